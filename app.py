@@ -5,6 +5,10 @@ import time
 import uuid
 from services.parser import extract_text_from_file
 from services.ai import get_client
+from services.assets import AssetPipeline
+from services.document import format_for_prompt, parse_resume_document
+from services.validation import get_validation_stats
+from services.matcher import ResumeMatcher
 from storage import Storage
 
 
@@ -12,8 +16,10 @@ def create_app():
     app = Flask(__name__)
     app.config["UPLOAD_FOLDER"] = os.path.join(os.getcwd(), "uploads")
     os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
+    AssetPipeline(os.path.join(app.root_path, "static")).init_app(app)
 
     storage = Storage()
+    matcher = ResumeMatcher()
 
     @app.route("/")
     def home():
@@ -71,10 +77,14 @@ def create_app():
                 "filename": filename,
                 "originalText": extracted_text,
             })
+            # Parse once; prompts, local scoring and the match index all read this document
+            document = parse_resume_document(extracted_text)
+            storage.save_document(resume["id"], document)
+            matcher.add_tokens(resume["id"], document["tokens"])
 
             # Use Gemini to analyze and generate outputs in parallel for better performance
             client = get_client()
-            gemini_results = client.generate_all_content_parallel(extracted_text)
+            gemini_results = client.generate_all_content_parallel(format_for_prompt(document, extracted_text))
             analysis = gemini_results["analysis"]
             technical_questions = gemini_results["technical_questions"]
             roadmap = gemini_results["roadmap"]
@@ -98,15 +108,16 @@ def create_app():
             analysis_row = {
                 "id": str(uuid.uuid4()),
                 "resumeId": resume["id"],
-                "ats_score": int(analysis.get("ats_score", 75)),
-                "overall_score": int(analysis.get("overall_score", 75)),
-                "keyword_match": int(analysis.get("keyword_match", 70)),
-                "format_quality": int(analysis.get("format_quality", 80)),
-                "grammar_style": int(analysis.get("grammar_style", 85)),
-                "content_strength": int(analysis.get("content_strength", 75)),
-                "feedback": analysis.get("feedback", {"strengths": [], "improvements": [], "issues": []}),
-                "skillsIdentified": analysis.get("skillsIdentified", []),
-                "careerStage": analysis.get("careerStage", "mid"),
+                # Fields are guaranteed by the schema validator in services/ai.py
+                "ats_score": round(analysis["ats_score"]),
+                "overall_score": round(analysis["overall_score"]),
+                "keyword_match": round(analysis["keyword_match"]),
+                "format_quality": round(analysis["format_quality"]),
+                "grammar_style": round(analysis["grammar_style"]),
+                "content_strength": round(analysis["content_strength"]),
+                "feedback": analysis["feedback"],
+                "skillsIdentified": analysis["skillsIdentified"],
+                "careerStage": analysis["careerStage"],
             }
             storage.analyses.append(analysis_row)
 
@@ -217,6 +228,7 @@ def create_app():
             })
 
             storage.bump_progress(user_id, int(analysis_row["overall_score"])) 
+            storage.record_scores(user_id, analysis_row)
 
             return jsonify({
                 "resume": resume,
@@ -240,6 +252,20 @@ def create_app():
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+    @app.get("/api/progress/history")
+    def progress_history():
+        try:
+            user_id = "default-user"
+            try:
+                max_points = int(request.args.get("maxPoints", 100))
+            except ValueError:
+                return jsonify({"error": "maxPoints must be an integer"}), 400
+            if max_points < 1:
+                return jsonify({"error": "maxPoints must be at least 1"}), 400
+            return jsonify(storage.get_score_history(user_id, max_points))
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
     @app.get("/api/analysis/<resume_id>")
     def get_analysis(resume_id: str):
         try:
@@ -268,6 +294,48 @@ def create_app():
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+    @app.get("/api/resumes/<resume_id>/document")
+    def get_resume_document(resume_id: str):
+        try:
+            document = storage.get_document_by_resume_id(resume_id)
+            if not document:
+                return jsonify({"error": "Resume document not found"}), 404
+            return jsonify(document)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @app.post("/api/match")
+    def match():
+        try:
+            body = request.get_json(silent=True) or {}
+            jobs = body.get("jobDescriptions")
+            if jobs is None and "jobDescription" in body:
+                jobs = [body["jobDescription"]]
+            if not isinstance(jobs, list) or not jobs or not all(isinstance(j, str) and j.strip() for j in jobs):
+                return jsonify({"error": "Provide jobDescription or a non-empty jobDescriptions list of strings"}), 400
+
+            resume_ids = body.get("resumeIds")
+            if resume_ids is not None and (not isinstance(resume_ids, list) or not all(isinstance(r, str) for r in resume_ids)):
+                return jsonify({"error": "resumeIds must be a list of strings"}), 400
+            top = body.get("top")
+            if top is not None and (isinstance(top, bool) or not isinstance(top, int) or top < 1):
+                return jsonify({"error": "top must be an integer >= 1"}), 400
+
+            try:
+                results = matcher.rank(jobs, resume_ids=resume_ids, top=top)
+            except KeyError as e:
+                return jsonify({"error": f"Resume not found: {e.args[0]}"}), 404
+            return jsonify({"totalResumes": len(matcher), "results": results})
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @app.get("/api/stats/validation")
+    def validation_stats():
+        try:
+            return jsonify(get_validation_stats())
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
     @app.get("/api/resumes")
     def get_resumes():
         try:
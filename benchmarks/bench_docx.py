@@ -0,0 +1,102 @@
+"""Benchmark the streaming DOCX reader against the python-docx path.
+
+Builds a corpus of large templated resumes (body paragraphs, skill tables,
+a text box, header and footer) and reports extraction time, peak Python
+memory and how many planted skill markers each implementation recovers.
+
+    python -m benchmarks.bench_docx [--sizes 500 2000 8000] [--repeat 3]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from services.docx_reader import extract_docx_text
+from services.parser import _extract_docx_python_docx
+
+
+_TEXTBOX_XML = (
+    '<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    ' xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+    ' xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"'
+    ' xmlns:v="urn:schemas-microsoft-com:vml">'
+    "<mc:AlternateContent><mc:Choice Requires=\"wps\"><w:drawing><wps:wsp><wps:txbx><w:txbxContent>"
+    "<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+    "</w:txbxContent></wps:txbx></wps:wsp></w:drawing></mc:Choice>"
+    "<mc:Fallback><w:pict><v:shape><v:textbox><w:txbxContent>"
+    "<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+    "</w:txbxContent></v:textbox></v:shape></w:pict></mc:Fallback></mc:AlternateContent></w:r>"
+)
+
+
+def build_resume(path: str, paragraphs: int) -> List[str]:
+    """Write a synthetic resume and return the skill markers planted in it."""
+    import docx  # python-docx
+    from docx.oxml import parse_xml
+
+    document = docx.Document()
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Jane Doe | jane@example.com | MARKER_HEADER"
+    section.footer.paragraphs[0].text = "References available on request MARKER_FOOTER"
+
+    anchor = document.add_paragraph("Summary")
+    anchor._p.append(parse_xml(_TEXTBOX_XML.format(text="Core skills: MARKER_TEXTBOX")))
+
+    markers = ["MARKER_HEADER", "MARKER_FOOTER", "MARKER_TEXTBOX"]
+    for i in range(paragraphs):
+        document.add_paragraph(
+            f"- Led project {i}: delivered a service handling {i * 10} requests per second "
+            "using Python, PostgreSQL and Docker while mentoring two engineers."
+        )
+        if i % 250 == 0:
+            table = document.add_table(rows=2, cols=3)
+            marker = f"MARKER_TABLE_{i}"
+            markers.append(marker)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = marker if (r, c) == (1, 2) else f"Skill {r}.{c}"
+    document.save(path)
+    return markers
+
+
+def _measure(fn: Callable[[str], str], path: str, repeat: int) -> Tuple[float, int, str]:
+    timings = []
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn(path)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak, text
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000])
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    impls: Dict[str, Callable[[str], str]] = {
+        "python-docx": _extract_docx_python_docx,
+        "streaming": extract_docx_text,
+    }
+    print(f"{'paragraphs':>10} {'size KB':>8} {'impl':>12} {'median s':>9} {'peak MB':>8} {'markers':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"resume_{size}.docx")
+            markers = build_resume(path, size)
+            kb = os.path.getsize(path) // 1024
+            for name, fn in impls.items():
+                seconds, peak, text = _measure(fn, path, args.repeat)
+                found = sum(1 for m in markers if m in text)
+                print(f"{size:>10} {kb:>8} {name:>12} {seconds:>9.3f} {peak / 2**20:>8.1f} {found:>4}/{len(markers):<3}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,122 @@ import asyncio
 import concurrent.futures
 from typing import Any, Dict, List
 
+from services.validation import compile_schema, parse_json, stats
+
+
+ANALYSIS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "ats_score": {"type": "number", "minimum": 0, "maximum": 100},
+        "overall_score": {"type": "number", "minimum": 0, "maximum": 100},
+        "keyword_match": {"type": "number", "minimum": 0, "maximum": 100},
+        "format_quality": {"type": "number", "minimum": 0, "maximum": 100},
+        "grammar_style": {"type": "number", "minimum": 0, "maximum": 100},
+        "content_strength": {"type": "number", "minimum": 0, "maximum": 100},
+        "feedback": {
+            "type": "object",
+            "properties": {
+                "strengths": {"type": "array", "items": {"type": "string"}, "minItems": 3, "maxItems": 5},
+                "improvements": {"type": "array", "items": {"type": "string"}, "minItems": 3, "maxItems": 5},
+                "issues": {"type": "array", "items": {"type": "string"}, "minItems": 2, "maxItems": 4},
+            },
+            "required": ["strengths", "improvements", "issues"],
+        },
+        "skillsIdentified": {"type": "array", "items": {"type": "string"}, "minItems": 10, "maxItems": 20},
+        "careerStage": {"type": "string", "enum": ["entry", "junior", "mid", "senior", "executive"]},
+    },
+    "required": [
+        "ats_score",
+        "overall_score",
+        "keyword_match", 
+        "format_quality",
+        "grammar_style",
+        "content_strength",
+        "feedback",
+        "skillsIdentified",
+        "careerStage",
+    ],
+}
+
+
+QUESTIONS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "questions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "question": {"type": "string"},
+                    "sampleAnswer": {"type": "string"},
+                    "type": {"type": "string", "enum": ["technical"]},
+                    "difficulty": {"type": "string", "enum": ["easy", "medium", "hard"]},
+                },
+                "required": ["question", "sampleAnswer", "type", "difficulty"],
+            },
+            "minItems": 1
+        }
+    },
+    "required": ["questions"],
+}
+
+
+ROADMAP_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "currentSkills": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "level": {"type": "string", "enum": ["beginner", "intermediate", "advanced", "expert"]},
+                },
+                "required": ["name", "level"],
+            },
+            "minItems": 5,
+            "maxItems": 15
+        },
+        "recommendedSkills": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "priority": {"type": "string", "enum": ["high", "medium", "low"]},
+                    "description": {"type": "string"},
+                },
+                "required": ["name", "priority", "description"],
+            },
+            "minItems": 5,
+            "maxItems": 8
+        },
+        "actionPlan": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "task": {"type": "string"},
+                    "estimatedWeeks": {"type": "number", "minimum": 1, "maximum": 12},
+                    "priority": {"type": "number", "minimum": 1, "maximum": 5},
+                },
+                "required": ["task", "estimatedWeeks", "priority"],
+            },
+            "minItems": 6,
+            "maxItems": 10
+        },
+        "timelineWeeks": {"type": "number", "minimum": 12, "maximum": 52},
+    },
+    "required": ["currentSkills", "recommendedSkills", "actionPlan", "timelineWeeks"],
+}
+
+
+_VALIDATORS = {
+    "analysis": compile_schema(ANALYSIS_SCHEMA),
+    "questions": compile_schema(QUESTIONS_SCHEMA),
+    "roadmap": compile_schema(ROADMAP_SCHEMA),
+}
+
 
 class GeminiClient:
     def __init__(self) -> None:
@@ -15,7 +131,7 @@ class GeminiClient:
         self.fast_model = os.environ.get("GEMINI_FAST_MODEL", "gemini-2.0-flash")
         self.quality_model = os.environ.get("GEMINI_QUALITY_MODEL", "gemini-2.5-pro")
 
-    def _generate_json(self, model: str, system_instruction: str, content: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    def _request_json(self, model: str, system_instruction: str, content: str, schema: Dict[str, Any]) -> str:
         # The python SDK supports response_mime_type and response_schema
         response = self.client.models.generate_content(
             model=model,
@@ -29,8 +145,45 @@ class GeminiClient:
         raw = getattr(response, "text", None)
         if not raw:
             raise RuntimeError("Empty response from Gemini")
-        import json
-        return json.loads(raw)
+        return raw
+
+    def _generate_json(self, model: str, system_instruction: str, content: str, kind: str) -> Dict[str, Any]:
+        """Request, validate and locally repair a response for one of the schemas above.
+
+        Only fields that cannot be repaired are requested again, with a schema
+        narrowed to those fields.
+        """
+        validator = _VALIDATORS[kind]
+        raw = self._request_json(model, system_instruction, content, validator.schema)
+        try:
+            parsed, text_repaired = parse_json(raw)
+        except ValueError:
+            parsed, text_repaired = None, False
+        result, report = validator.validate(parsed)
+        repaired = text_repaired or report.repaired
+        if not report.unrecoverable:
+            stats.record(kind, repaired=repaired)
+            return result
+
+        missing = report.unrecoverable
+        retry_validator = compile_schema(validator.subschema(missing))
+        retry_raw = self._request_json(
+            model,
+            f"{system_instruction}\n\nReturn ONLY these fields: {', '.join(missing)}.",
+            content,
+            retry_validator.schema,
+        )
+        try:
+            retry_parsed, _ = parse_json(retry_raw)
+        except ValueError:
+            retry_parsed = None
+        retry, retry_report = retry_validator.validate(retry_parsed)
+        if retry_report.unrecoverable:
+            stats.record(kind, repaired=repaired, rerequested=True, failed=True)
+            raise RuntimeError(f"Gemini response is missing required fields: {', '.join(retry_report.unrecoverable)}")
+        stats.record(kind, repaired=repaired, rerequested=True)
+        result.update(retry)
+        return result
 
     def analyze_resume(self, resume_text: str) -> Dict[str, Any]:
         system_prompt = (
@@ -50,44 +203,11 @@ class GeminiClient:
             "- skills: 10-20 technical and professional skills identified\n"
             "- career stage: Current career level (entry, junior, mid, senior, executive)"
         )
-        schema: Dict[str, Any] = {
-            "type": "object",
-            "properties": {
-                "ats_score": {"type": "number", "minimum": 0, "maximum": 100},
-                "overall_score": {"type": "number", "minimum": 0, "maximum": 100},
-                "keyword_match": {"type": "number", "minimum": 0, "maximum": 100},
-                "format_quality": {"type": "number", "minimum": 0, "maximum": 100},
-                "grammar_style": {"type": "number", "minimum": 0, "maximum": 100},
-                "content_strength": {"type": "number", "minimum": 0, "maximum": 100},
-                "feedback": {
-                    "type": "object",
-                    "properties": {
-                        "strengths": {"type": "array", "items": {"type": "string"}, "minItems": 3, "maxItems": 5},
-                        "improvements": {"type": "array", "items": {"type": "string"}, "minItems": 3, "maxItems": 5},
-                        "issues": {"type": "array", "items": {"type": "string"}, "minItems": 2, "maxItems": 4},
-                    },
-                    "required": ["strengths", "improvements", "issues"],
-                },
-                "skillsIdentified": {"type": "array", "items": {"type": "string"}, "minItems": 10, "maxItems": 20},
-                "careerStage": {"type": "string", "enum": ["entry", "junior", "mid", "senior", "executive"]},
-            },
-            "required": [
-                "ats_score",
-                "overall_score",
-                "keyword_match", 
-                "format_quality",
-                "grammar_style",
-                "content_strength",
-                "feedback",
-                "skillsIdentified",
-                "careerStage",
-            ],
-        }
         result = self._generate_json(
             model=self.fast_model,
             system_instruction=system_prompt,
             content=f"Analyze this resume:\n\n{resume_text}",
-            schema=schema,
+            kind="analysis",
         )
         return result
 
@@ -102,30 +222,11 @@ class GeminiClient:
             "- Technology-specific best practices\n\n"
             "Each question should include: question, sampleAnswer (2-3 sentences), difficulty (easy/medium/hard)."
         )
-        schema: Dict[str, Any] = {
-            "type": "object",
-            "properties": {
-                "questions": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "question": {"type": "string"},
-                            "sampleAnswer": {"type": "string"},
-                            "type": {"type": "string", "enum": ["technical"]},
-                            "difficulty": {"type": "string", "enum": ["easy", "medium", "hard"]},
-                        },
-                        "required": ["question", "sampleAnswer", "type", "difficulty"],
-                    },
-                }
-            },
-            "required": ["questions"],
-        }
         result = self._generate_json(
             model=self.fast_model,
             system_instruction=system_prompt,
             content=f"Generate technical interview questions for this resume:\n\n{resume_text}",
-            schema=schema,
+            kind="questions",
         )
         questions = result.get("questions", [])
         return questions[:count]
@@ -145,54 +246,6 @@ class GeminiClient:
             "- timelineWeeks: Overall roadmap duration (12-52 weeks)\n\n"
             "Focus on skills and actions that will have the biggest career impact for their specific role and industry."
         )
-        schema: Dict[str, Any] = {
-            "type": "object",
-            "properties": {
-                "currentSkills": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "level": {"type": "string", "enum": ["beginner", "intermediate", "advanced", "expert"]},
-                        },
-                        "required": ["name", "level"],
-                    },
-                    "minItems": 5,
-                    "maxItems": 15
-                },
-                "recommendedSkills": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "priority": {"type": "string", "enum": ["high", "medium", "low"]},
-                            "description": {"type": "string"},
-                        },
-                        "required": ["name", "priority", "description"],
-                    },
-                    "minItems": 5,
-                    "maxItems": 8
-                },
-                "actionPlan": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "task": {"type": "string"},
-                            "estimatedWeeks": {"type": "number", "minimum": 1, "maximum": 12},
-                            "priority": {"type": "number", "minimum": 1, "maximum": 5},
-                        },
-                        "required": ["task", "estimatedWeeks", "priority"],
-                    },
-                    "minItems": 6,
-                    "maxItems": 10
-                },
-                "timelineWeeks": {"type": "number", "minimum": 12, "maximum": 52},
-            },
-            "required": ["currentSkills", "recommendedSkills", "actionPlan", "timelineWeeks"],
-        }
         result = self._generate_json(
             model=self.quality_model,
             system_instruction=system_prompt,
@@ -202,7 +255,7 @@ class GeminiClient:
                 f"Identified Skills: {', '.join(skills_identified)}\n\n" +
                 "Focus on their specific industry, role, and career level to provide the most relevant recommendations."
             ),
-            schema=schema,
+            kind="roadmap",
         )
         return result
 
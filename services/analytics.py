@@ -0,0 +1,148 @@
+import threading
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+
+# Dashboard dimension -> key in the stored analysis row
+SCORE_DIMENSIONS: Dict[str, str] = {
+    "ats": "ats_score",
+    "keyword": "keyword_match",
+    "format": "format_quality",
+    "grammar": "grammar_style",
+    "content": "content_strength",
+}
+
+# Fewer users than this and a percentile is just the user ranked against themselves
+MIN_POPULATION = 2
+
+
+class ScoreSeries:
+    """Append-only, array-backed score history for a single user."""
+
+    def __init__(self) -> None:
+        self.timestamps = array("d")
+        self.values: Dict[str, array] = {dim: array("f") for dim in SCORE_DIMENSIONS}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, ts: float, scores: Dict[str, float]) -> None:
+        self.timestamps.append(ts)
+        for dim, col in self.values.items():
+            col.append(scores[dim])
+
+    def downsample(self, max_points: int) -> List[Dict[str, Any]]:
+        """Average consecutive runs so at most max_points buckets remain.
+
+        With max_points >= 2 the newest upload lands in the last bucket on its
+        own so the chart ends on the current score rather than a smoothed one;
+        max_points == 1 averages the whole history into a single bucket.
+        """
+        n = len(self.timestamps)
+        if n == 0:
+            return []
+        if n <= max_points or max_points < 2:
+            bounds = [(i, i + 1) for i in range(n)] if n <= max_points else [(0, n)]
+        else:
+            head = n - 1
+            buckets = max_points - 1
+            bounds = [(head * b // buckets, head * (b + 1) // buckets) for b in range(buckets)]
+            bounds.append((head, n))
+
+        points: List[Dict[str, Any]] = []
+        for start, end in bounds:
+            size = end - start
+            point: Dict[str, Any] = {
+                "timestamp": self.timestamps[end - 1],
+                "count": size,
+            }
+            for dim, col in self.values.items():
+                point[dim] = round(sum(col[start:end]) / size, 1)
+            points.append(point)
+        return points
+
+
+class ScoreHistogram:
+    """Streaming quantile sketch over integer scores in 0..100.
+
+    The score domain is tiny and bounded, so a 101-bin histogram is an exact
+    sketch. The cumulative table is refreshed on every update (101 adds) which
+    makes rank lookups a constant-time read.
+    """
+
+    BINS = 101
+
+    def __init__(self) -> None:
+        self.counts = array("l", [0] * self.BINS)
+        self.below = array("l", [0] * (self.BINS + 1))
+        self.total = 0
+
+    @staticmethod
+    def _bin(score: float) -> int:
+        return max(0, min(ScoreHistogram.BINS - 1, int(round(score))))
+
+    def _refresh(self) -> None:
+        running = 0
+        for i, c in enumerate(self.counts):
+            self.below[i] = running
+            running += c
+        self.below[self.BINS] = running
+
+    def replace(self, old: Optional[float], new: float) -> None:
+        if old is not None:
+            self.counts[self._bin(old)] -= 1
+            self.total -= 1
+        self.counts[self._bin(new)] += 1
+        self.total += 1
+        self._refresh()
+
+    def percentile(self, score: float) -> Optional[int]:
+        """Mid-rank percentile of score within the population."""
+        if self.total < MIN_POPULATION:
+            return None
+        b = self._bin(score)
+        rank = self.below[b] + self.counts[b] / 2.0
+        return int(round(100.0 * rank / self.total))
+
+
+class ScoreAnalytics:
+    """Per-user score history plus population percentiles across all users.
+
+    Each user contributes their latest score per dimension to the population
+    histograms; a new upload swaps the old bin for the new one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.series: Dict[str, ScoreSeries] = {}
+        self.latest: Dict[str, Dict[str, float]] = {}
+        self.population: Dict[str, ScoreHistogram] = {dim: ScoreHistogram() for dim in SCORE_DIMENSIONS}
+
+    def record(self, user_id: str, analysis: Dict[str, Any], ts: Optional[float] = None) -> None:
+        scores = {dim: float(analysis.get(key, 0)) for dim, key in SCORE_DIMENSIONS.items()}
+        with self._lock:
+            self.series.setdefault(user_id, ScoreSeries()).append(ts if ts is not None else time.time(), scores)
+            previous = self.latest.get(user_id)
+            for dim, value in scores.items():
+                self.population[dim].replace(previous[dim] if previous else None, value)
+            self.latest[user_id] = scores
+
+    def percentiles(self, user_id: str) -> Optional[Dict[str, Optional[int]]]:
+        with self._lock:
+            latest = self.latest.get(user_id)
+            if latest is None:
+                return None
+            return {dim: self.population[dim].percentile(value) for dim, value in latest.items()}
+
+    def history(self, user_id: str, max_points: int = 100) -> Dict[str, Any]:
+        with self._lock:
+            series = self.series.get(user_id)
+            points = series.downsample(max_points) if series else []
+            total = len(series) if series else 0
+        return {
+            "userId": user_id,
+            "totalPoints": total,
+            "downsampled": len(points) < total,
+            "points": points,
+        }
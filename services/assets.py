@@ -0,0 +1,132 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from flask import Flask, Response, abort, request
+
+
+# Fingerprinted URLs never change content, so browsers may keep them for a year
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+# The HTML shell is revalidated on every navigation against its ETag
+HTML_CACHE = "no-cache"
+MIN_COMPRESS_BYTES = 512
+# Compressed HTML bodies kept per ETag; pages are static so a few slots suffice
+HTML_CACHE_SIZE = 32
+
+
+def _brotli() -> Optional[Any]:
+    try:
+        import brotli  # type: ignore
+    except Exception:
+        return None
+    return brotli
+
+
+def _accepts(encoding: str) -> bool:
+    # Indexing returns the quality, so "gzip;q=0" counts as refused
+    return request.accept_encodings[encoding] > 0
+
+
+class AssetPipeline:
+    """Fingerprinted, precompressed static assets plus compressed HTML pages.
+
+    Every CSS/JS file under static/ is read once at startup, named by a hash
+    of its content and stored with gzip (and brotli, if installed) variants,
+    so requests are served from memory without compressing anything.
+    Templates reference assets through ``asset_url('css/home.css')``.
+    """
+
+    def __init__(self, static_dir: str, url_prefix: str = "/assets") -> None:
+        self.static_dir = static_dir
+        self.url_prefix = url_prefix
+        self.manifest: Dict[str, str] = {}
+        # hashed name -> (mimetype, {encoding: body})
+        self.files: Dict[str, Tuple[str, Dict[str, bytes]]] = {}
+        self._html_gzip: Dict[str, bytes] = {}
+
+    def build(self) -> None:
+        brotli = _brotli()
+        manifest: Dict[str, str] = {}
+        files: Dict[str, Tuple[str, Dict[str, bytes]]] = {}
+        for dirpath, _, filenames in os.walk(self.static_dir):
+            for filename in sorted(filenames):
+                if not filename.endswith((".css", ".js")):
+                    continue
+                path = os.path.join(dirpath, filename)
+                logical = os.path.relpath(path, self.static_dir).replace(os.sep, "/")
+                with open(path, "rb") as f:
+                    body = f.read()
+                stem, ext = os.path.splitext(logical)
+                hashed = f"{stem}.{hashlib.sha256(body).hexdigest()[:12]}{ext}"
+                variants = {"identity": body}
+                # Tiny files come out larger once compressed, so they are served as-is
+                if len(body) >= MIN_COMPRESS_BYTES:
+                    variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+                    if brotli is not None:
+                        variants["br"] = brotli.compress(body)
+                mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                manifest[logical] = hashed
+                files[hashed] = (mimetype, variants)
+        self.manifest = manifest
+        self.files = files
+
+    def asset_url(self, logical: str) -> str:
+        hashed = self.manifest.get(logical)
+        if hashed is None:
+            raise KeyError(f"Unknown asset: {logical}")
+        return f"{self.url_prefix}/{hashed}"
+
+    def serve(self, hashed: str) -> Response:
+        entry = self.files.get(hashed)
+        if entry is None:
+            abort(404)
+        mimetype, variants = entry
+        encoding = next((e for e in ("br", "gzip") if e in variants and _accepts(e)), "identity")
+        response = Response(variants[encoding], mimetype=mimetype)
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE
+        response.headers["Vary"] = "Accept-Encoding"
+        # Weak, because the same tag is sent for every encoding of the file
+        response.set_etag(hashed.rsplit(".", 2)[-2], weak=True)
+        return response.make_conditional(request)
+
+    def finalize_html(self, response: Response) -> Response:
+        """ETag, conditional 304 and gzip for rendered pages."""
+        if (
+            request.method not in ("GET", "HEAD")
+            or response.status_code != 200
+            or response.mimetype != "text/html"
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+        # Weak, because the same tag is sent for the gzip and identity bodies
+        response.add_etag(weak=True)
+        response.headers["Cache-Control"] = HTML_CACHE
+        response.headers["Vary"] = "Accept-Encoding"
+        response.make_conditional(request)
+        if response.status_code != 200 or not _accepts("gzip"):
+            return response
+
+        body = response.get_data()
+        if len(body) < MIN_COMPRESS_BYTES:
+            return response
+        etag = response.get_etag()[0]
+        compressed = self._html_gzip.get(etag)
+        if compressed is None:
+            compressed = gzip.compress(body, compresslevel=6, mtime=0)
+            if len(self._html_gzip) >= HTML_CACHE_SIZE:
+                self._html_gzip.pop(next(iter(self._html_gzip)), None)
+            self._html_gzip[etag] = compressed
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    def init_app(self, app: Flask) -> None:
+        self.build()
+        app.add_url_rule(f"{self.url_prefix}/<path:hashed>", "assets", self.serve)
+        app.add_template_global(self.asset_url, "asset_url")
+        app.after_request(self.finalize_html)
@@ -0,0 +1,225 @@
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Canonical section -> headings that introduce it (compared lower-cased, without punctuation)
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    "summary": ["summary", "professional summary", "profile", "professional profile", "objective", "career objective", "about me"],
+    "experience": ["experience", "work experience", "professional experience", "employment", "employment history", "work history", "career history"],
+    "education": ["education", "academic background", "education and training", "qualifications"],
+    "skills": ["skills", "technical skills", "core skills", "key skills", "core competencies", "competencies", "technologies", "tech stack"],
+    "projects": ["projects", "personal projects", "key projects", "academic projects"],
+    "certifications": ["certifications", "certificates", "licenses and certifications", "courses"],
+    "achievements": ["achievements", "awards", "honors", "honors and awards", "accomplishments"],
+    "volunteering": ["volunteering", "volunteer experience", "volunteer work", "community involvement"],
+    "publications": ["publications", "research", "patents"],
+    "languages": ["languages", "spoken languages"],
+    "interests": ["interests", "hobbies", "hobbies and interests"],
+    "references": ["references"],
+}
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+# "/" usually joins alternatives ("Python/Django"), except in these whole terms
+SLASH_TERMS = frozenset(["ci/cd", "pl/sql"])
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the their this to we will with you your".split()
+)
+
+_HEADING_LOOKUP = {h: name for name, headings in SECTION_HEADINGS.items() for h in headings}
+_BULLET_RE = re.compile(r"^\s*(?:[-*•▪◦●–]|\d+[.)])\s+")
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE_RE = re.compile(r"\+?\(?\d[\d\s().-]{7,}\d")
+_URL_RE = re.compile(r"(?:https?://|www\.)\S+|\b(?:linkedin\.com|github\.com)/\S+", re.IGNORECASE)
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}})"
+_DATE_RANGE_RE = re.compile(
+    rf"(?P<start>{_DATE})\s*(?:-|–|—|to)\s*(?P<end>{_DATE}|present|current|now|today)|(?P<single>{_DATE})",
+    re.IGNORECASE,
+)
+_SKILL_SPLIT_RE = re.compile(r"[,;|•·\n]")
+_SLASH_PART_RE = re.compile(r"[a-z0-9][a-z0-9+#.-]*")
+
+
+def iter_tokens(text: str) -> Iterator[Tuple[str, int]]:
+    """Yield (token, offset) pairs; the same tokenization the matcher indexes."""
+    for match in TOKEN_RE.finditer(text.lower()):
+        tok = match.group().rstrip("./-")
+        if "/" in tok and tok not in SLASH_TERMS:
+            for part in _SLASH_PART_RE.finditer(tok):
+                sub = part.group().rstrip(".-")
+                if sub and sub not in STOPWORDS:
+                    yield sub, match.start() + part.start()
+        elif tok and tok not in STOPWORDS:
+            yield tok, match.start()
+
+
+def tokenize(text: str) -> List[str]:
+    return [tok for tok, _ in iter_tokens(text)]
+
+
+def _lines(text: str) -> Iterator[Tuple[str, int, int]]:
+    offset = 0
+    for line in text.split("\n"):
+        yield line, offset, offset + len(line)
+        offset += len(line) + 1
+
+
+def _heading(line: str) -> Optional[str]:
+    stripped = line.strip()
+    if not stripped or len(stripped) > 40:
+        return None
+    key = re.sub(r"[^a-z& ]", "", stripped.lower()).replace("&", "and")
+    key = re.sub(r"\s+", " ", key).strip()
+    # Only known headings split sections; all-caps names and employer lines are content
+    return _HEADING_LOOKUP.get(key)
+
+
+def _parse_dates(line: str) -> Optional[Dict[str, Any]]:
+    match = _DATE_RANGE_RE.search(line)
+    if not match:
+        return None
+    if match.group("single"):
+        return {"raw": match.group(), "start": None, "end": match.group("single"), "current": False}
+    end = match.group("end")
+    return {
+        "raw": match.group(),
+        "start": match.group("start"),
+        "end": end,
+        "current": end.lower() in ("present", "current", "now", "today"),
+    }
+
+
+def _split_entries(lines: List[Tuple[str, int, int]]) -> List[Dict[str, Any]]:
+    """Group a section's lines into entries: header lines followed by bullets."""
+    entries: List[Dict[str, Any]] = []
+    current: Optional[Dict[str, Any]] = None
+    after_blank = False
+    for line, start, end in lines:
+        if not line.strip():
+            after_blank = True
+            continue
+        bullet = _BULLET_RE.match(line)
+        dates = None if bullet else _parse_dates(line)
+        starts_new = current is None or (
+            not bullet and (after_blank or current["bullets"] or (dates and current["dates"]))
+        )
+        if starts_new:
+            current = {"header": [], "dates": None, "bullets": [], "start": start, "end": end}
+            entries.append(current)
+        if bullet:
+            current["bullets"].append({"text": line[bullet.end():].strip(), "start": start + bullet.end(), "end": end})
+        else:
+            current["header"].append(line.strip())
+            if dates and not current["dates"]:
+                current["dates"] = dates
+        current["end"] = end
+        after_blank = False
+
+    for entry in entries:
+        header = entry.pop("header")
+        entry["title"] = header[0] if header else ""
+        entry["details"] = header[1:]
+    return entries
+
+
+def _parse_contact(lines: List[Tuple[str, int, int]]) -> Dict[str, Any]:
+    block = "\n".join(line for line, _, _ in lines)
+    name = next((line.strip() for line, _, _ in lines if line.strip() and not _EMAIL_RE.search(line) and not _URL_RE.search(line)), None)
+    # Date ranges like "2015 - 2019" look like phone numbers; require enough digits
+    phone = next((m.group().strip() for m in _PHONE_RE.finditer(block) if sum(c.isdigit() for c in m.group()) >= 9), None)
+    return {
+        "name": name,
+        "email": next(iter(_EMAIL_RE.findall(block)), None),
+        "phone": phone,
+        "links": _URL_RE.findall(block),
+    }
+
+
+def _parse_skills(lines: List[Tuple[str, int, int]]) -> List[str]:
+    skills: List[str] = []
+    seen = set()
+    for line, _, _ in lines:
+        line = _BULLET_RE.sub("", line)
+        # "Languages: Python, Go" -> "Python, Go"
+        if ":" in line:
+            line = line.split(":", 1)[1]
+        for part in _SKILL_SPLIT_RE.split(line):
+            skill = part.strip(" .")
+            if skill and len(skill) <= 40 and skill.casefold() not in seen:
+                seen.add(skill.casefold())
+                skills.append(skill)
+    return skills
+
+
+def parse_resume_document(text: str) -> Dict[str, Any]:
+    """Segment extracted resume text once into a structured, JSON-ready document.
+
+    All offsets are character positions into ``text``. ``tokens`` keeps the
+    matcher's token stream in order (with ``tokenOffsets`` alongside) and
+    ``tokenIndex`` maps each token to the offsets where it occurs.
+    """
+    lines = list(_lines(text))
+    sections: List[Dict[str, Any]] = []
+    section_lines: Dict[str, List[Tuple[str, int, int]]] = {}
+    contact_lines: List[Tuple[str, int, int]] = []
+    current: Optional[Dict[str, Any]] = None
+
+    bullets: List[Dict[str, Any]] = []
+    for line, start, end in lines:
+        name = _heading(line)
+        if name is not None:
+            current = {"name": name, "heading": line.strip(), "start": start, "bodyStart": end + 1, "end": end}
+            sections.append(current)
+            section_lines.setdefault(name, [])
+            continue
+        if current is None:
+            contact_lines.append((line, start, end))
+            continue
+        current["end"] = end
+        section_lines[current["name"]].append((line, start, end))
+        match = _BULLET_RE.match(line)
+        if match:
+            bullets.append({"section": current["name"], "text": line[match.end():].strip(), "start": start + match.end(), "end": end})
+
+    tokens: List[str] = []
+    offsets: List[int] = []
+    index: Dict[str, List[int]] = {}
+    for tok, offset in iter_tokens(text):
+        tokens.append(tok)
+        offsets.append(offset)
+        index.setdefault(tok, []).append(offset)
+
+    summary = section_lines.get("summary", [])
+    return {
+        "contact": _parse_contact(contact_lines),
+        "summary": " ".join(line.strip() for line, _, _ in summary if line.strip()),
+        "sections": sections,
+        "experience": _split_entries(section_lines.get("experience", [])),
+        "education": _split_entries(section_lines.get("education", [])),
+        "projects": _split_entries(section_lines.get("projects", [])),
+        "skills": _parse_skills(section_lines.get("skills", [])),
+        "bullets": bullets,
+        "wordCount": len(text.split()),
+        "tokens": tokens,
+        "tokenOffsets": offsets,
+        "tokenIndex": index,
+    }
+
+
+def format_for_prompt(document: Dict[str, Any], text: str) -> str:
+    """Render the resume with each section tagged by its canonical name for model prompts.
+
+    Falls back to the raw text when no sections were recognized.
+    """
+    if not document["sections"]:
+        return text
+    parts: List[str] = []
+    header = text[:document["sections"][0]["start"]].strip()
+    if header:
+        parts.append(f"[CONTACT]\n{header}")
+    for section in document["sections"]:
+        body = text[section["bodyStart"]:section["end"]].strip()
+        if body:
+            label = section["name"].upper()
+            parts.append(f"[{label}] {section['heading']}\n{body}")
+    return "\n\n".join(parts)
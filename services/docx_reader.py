@@ -0,0 +1,151 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, List, Optional
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_BODY = _W + "body"
+_P = _W + "p"
+_T = _W + "t"
+_TAB = _W + "tab"
+_BREAKS = (_W + "br", _W + "cr")
+_TR = _W + "tr"
+_TC = _W + "tc"
+
+_PART_RE = re.compile(r"^word/(header|footer)(\d*)\.xml$")
+
+
+def _iter_part_lines(stream: IO[bytes]) -> Iterator[str]:
+    """Yield the text lines of one WordprocessingML part in document order.
+
+    Paragraphs become lines, table rows become one line with cells joined by
+    " | ", and text-box lines follow the paragraph they are anchored in.
+    Completed top-level blocks are cleared from the tree so memory stays
+    bounded by the largest single paragraph or table rather than by the
+    document.
+    """
+    paragraphs: List[List[str]] = []
+    # Text-box lines anchored in each open paragraph, emitted after it
+    anchored: List[List[str]] = []
+    rows: List[List[str]] = []
+    cells: List[List[str]] = []
+    root: Optional[ET.Element] = None
+    body: Optional[ET.Element] = None
+    # Text boxes are stored twice (DrawingML + VML fallback); read only the first
+    skip = 0
+
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if root is None:
+                root = elem
+            if tag == _MC_FALLBACK:
+                skip += 1
+            elif skip:
+                continue
+            elif tag == _P:
+                paragraphs.append([])
+                anchored.append([])
+            elif tag == _TR:
+                rows.append([])
+            elif tag == _TC:
+                cells.append([])
+            elif tag == _BODY:
+                body = elem
+            continue
+
+        if tag == _MC_FALLBACK:
+            skip -= 1
+            continue
+        if skip:
+            continue
+
+        if tag == _T:
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == _TAB:
+            if paragraphs:
+                paragraphs[-1].append("\t")
+        elif tag in _BREAKS:
+            if paragraphs:
+                paragraphs[-1].append("\n")
+        elif tag == _P:
+            text = "".join(paragraphs.pop())
+            boxes = anchored.pop()
+            if paragraphs:
+                # Text-box paragraph: hold it until the anchoring paragraph ends
+                anchored[-1].append(text)
+                anchored[-1].extend(boxes)
+            elif cells:
+                cells[-1].extend(line.strip() for line in [text, *boxes] if line.strip())
+            else:
+                yield text
+                yield from boxes
+        elif tag == _TC:
+            rows[-1].append(" ".join(cells.pop()))
+        elif tag == _TR:
+            line = " | ".join(c for c in rows.pop() if c)
+            if paragraphs:
+                # Table inside a text box
+                if line:
+                    anchored[-1].append(line)
+            elif cells:
+                # Nested table: keep it inside the enclosing cell
+                if line:
+                    cells[-1].append(line)
+            elif line:
+                yield line
+        else:
+            continue
+
+        # Top-level tables are cleared row by row, so no </w:tbl> case is needed
+        if tag in (_P, _TR) and not paragraphs and not cells:
+            container = body if body is not None else root
+            if container is not None:
+                container.clear()
+
+
+def _part_order(name: str) -> int:
+    match = _PART_RE.match(name)
+    return int(match.group(2) or 0) if match else 0
+
+
+def extract_docx_text(path: str) -> str:
+    """Extract text from a .docx by stream-parsing its XML parts.
+
+    Reads headers, the main document (including tables and text boxes) and
+    footers, in that order. Header/footer parts that repeat the same text
+    (first-page/even-page variants) are emitted once.
+    """
+    with zipfile.ZipFile(path) as zf:
+        names = zf.namelist()
+        headers = sorted((n for n in names if _PART_RE.match(n) and "header" in n), key=_part_order)
+        footers = sorted((n for n in names if _PART_RE.match(n) and "footer" in n), key=_part_order)
+        if "word/document.xml" not in names:
+            raise RuntimeError("Not a Word document: word/document.xml is missing")
+
+        seen_parts = set()
+        sections: List[str] = []
+
+        def read_part(name: str, dedupe: bool) -> None:
+            with zf.open(name) as stream:
+                text = "\n".join(_iter_part_lines(stream))
+            if not text.strip():
+                return
+            if dedupe:
+                key = text.strip()
+                if key in seen_parts:
+                    return
+                seen_parts.add(key)
+            sections.append(text)
+
+        for name in headers:
+            read_part(name, dedupe=True)
+        read_part("word/document.xml", dedupe=False)
+        for name in footers:
+            read_part(name, dedupe=True)
+
+    return "\n".join(sections)
@@ -0,0 +1,313 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from services.document import tokenize
+
+
+# Canonical skill -> aliases as they tend to appear in resumes and job posts.
+# Every alias is matched on token boundaries after lower-casing.
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    "python": ["python", "python3"],
+    "java": ["java"],
+    "javascript": ["javascript", "js", "es6"],
+    "typescript": ["typescript", "ts"],
+    "go": ["golang"],
+    "c++": ["c++", "cpp"],
+    "c#": ["c#", "csharp", "dotnet"],
+    "sql": ["sql", "t-sql", "pl/sql"],
+    "react": ["react", "reactjs", "react.js"],
+    "angular": ["angular", "angularjs"],
+    "vue": ["vue", "vuejs", "vue.js"],
+    "node": ["node", "nodejs", "node.js"],
+    "django": ["django"],
+    "flask": ["flask"],
+    "spring": ["spring boot", "spring framework", "spring mvc"],
+    "postgres": ["postgres", "postgresql"],
+    "mysql": ["mysql"],
+    "mongodb": ["mongodb", "mongo"],
+    "redis": ["redis"],
+    "aws": ["aws", "amazon web services"],
+    "gcp": ["gcp", "google cloud"],
+    "azure": ["azure"],
+    "docker": ["docker"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "terraform": ["terraform"],
+    "ci/cd": ["ci/cd", "jenkins", "github actions", "gitlab ci"],
+    "git": ["git"],
+    "linux": ["linux", "unix"],
+    "machine learning": ["machine learning", "ml"],
+    "deep learning": ["deep learning"],
+    "tensorflow": ["tensorflow"],
+    "pytorch": ["pytorch"],
+    "data analysis": ["data analysis", "pandas", "numpy"],
+    "rest api": ["restful", "rest api", "rest apis"],
+    "graphql": ["graphql"],
+    "microservices": ["microservices", "microservice"],
+    "system design": ["system design", "distributed systems"],
+    "agile": ["agile", "scrum", "kanban"],
+}
+
+def _build_alias_index() -> Tuple[Dict[str, int], Dict[Tuple[str, ...], int], int]:
+    unigrams: Dict[str, int] = {}
+    phrases: Dict[Tuple[str, ...], int] = {}
+    max_len = 1
+    for col, aliases in enumerate(SKILL_TAXONOMY.values()):
+        for alias in aliases:
+            parts = tuple(alias.split())
+            if len(parts) == 1:
+                unigrams[parts[0]] = col
+            else:
+                phrases[parts] = col
+                max_len = max(max_len, len(parts))
+    return unigrams, phrases, max_len
+
+
+_SKILL_NAMES = list(SKILL_TAXONOMY.keys())
+_SKILL_UNIGRAMS, _SKILL_PHRASES, _SKILL_MAX_LEN = _build_alias_index()
+
+
+def extract_skill_columns(tokens: Sequence[str]) -> List[int]:
+    found = set()
+    for i, tok in enumerate(tokens):
+        col = _SKILL_UNIGRAMS.get(tok)
+        if col is not None:
+            found.add(col)
+        for n in range(2, _SKILL_MAX_LEN + 1):
+            if i + n > len(tokens):
+                break
+            col = _SKILL_PHRASES.get(tuple(tokens[i:i + n]))
+            if col is not None:
+                found.add(col)
+    return sorted(found)
+
+
+class ResumeMatcher:
+    """Sparse TF-IDF + skill-taxonomy index over stored resumes.
+
+    Log-tf rows are appended into growable CSR buffers as resumes arrive, so
+    adding a resume never touches the existing pool. IDF weighting and row
+    normalization are reapplied lazily over those buffers when scores are
+    requested after an upload.
+    """
+
+    def __init__(self, skill_weight: float = 0.4) -> None:
+        # Lazy import to avoid import error if dependency missing during tooling
+        import numpy as np  # type: ignore
+        from scipy import sparse  # type: ignore
+
+        self._np = np
+        self._sparse = sparse
+        self.skill_weight = skill_weight
+        self._lock = threading.Lock()
+        self._vocab: Dict[str, int] = {}
+        self._doc_freq = np.zeros(1024, dtype=np.int64)
+        self._ids: List[str] = []
+        self._row_of: Dict[str, int] = {}
+        # Growable CSR buffers holding log-tf rows; only [:nnz] / [:rows + 1] are live
+        self._indptr = np.zeros(64, dtype=np.int64)
+        self._indices = np.zeros(4096, dtype=np.int64)
+        self._logtf = np.zeros(4096, dtype=np.float64)
+        self._nnz = 0
+        self._skill_indptr = np.zeros(64, dtype=np.int64)
+        self._skill_indices = np.zeros(256, dtype=np.int64)
+        self._skill_nnz = 0
+        self._cache: Optional[Tuple[Any, Any, Any, List[str], Dict[str, int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def resume_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._ids)
+
+    def _grow(self, buf: Any, needed: int) -> Any:
+        if needed <= len(buf):
+            return buf
+        grown = self._np.zeros(max(len(buf) * 2, needed), dtype=buf.dtype)
+        grown[:len(buf)] = buf
+        return grown
+
+    def add_resume(self, resume_id: str, text: str) -> None:
+        self.add_tokens(resume_id, tokenize(text))
+
+    def add_tokens(self, resume_id: str, tokens: Sequence[str]) -> None:
+        np = self._np
+        skills = extract_skill_columns(tokens)
+        counts: Dict[int, int] = {}
+        with self._lock:
+            if resume_id in self._row_of:
+                raise ValueError(f"Resume already indexed: {resume_id}")
+            for tok in tokens:
+                col = self._vocab.get(tok)
+                if col is None:
+                    col = self._vocab[tok] = len(self._vocab)
+                counts[col] = counts.get(col, 0) + 1
+
+            cols = np.fromiter(sorted(counts), dtype=np.int64, count=len(counts))
+            if len(cols):
+                self._doc_freq = self._grow(self._doc_freq, int(cols[-1]) + 1)
+            self._doc_freq[cols] += 1
+
+            row = len(self._ids)
+            start, end = self._nnz, self._nnz + len(cols)
+            self._indices = self._grow(self._indices, end)
+            self._logtf = self._grow(self._logtf, end)
+            self._indptr = self._grow(self._indptr, row + 2)
+            self._indices[start:end] = cols
+            self._logtf[start:end] = 1.0 + np.log(np.fromiter((counts[c] for c in cols.tolist()), dtype=np.float64, count=len(cols)))
+            self._indptr[row + 1] = end
+            self._nnz = end
+
+            s_start, s_end = self._skill_nnz, self._skill_nnz + len(skills)
+            self._skill_indices = self._grow(self._skill_indices, s_end)
+            self._skill_indptr = self._grow(self._skill_indptr, row + 2)
+            self._skill_indices[s_start:s_end] = skills
+            self._skill_indptr[row + 1] = s_end
+            self._skill_nnz = s_end
+
+            self._row_of[resume_id] = row
+            self._ids.append(resume_id)
+            self._cache = None
+
+    def _idf(self, n_docs: int, n_terms: int) -> Any:
+        np = self._np
+        df = self._doc_freq[:n_terms]
+        return np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+
+    def _normalize(self, logtf: Any, idf: Any) -> Any:
+        np = self._np
+        weighted = logtf @ self._sparse.diags(idf)
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return self._sparse.diags(1.0 / norms) @ weighted
+
+    def _skill_matrix(self, rows: Sequence[Sequence[int]]) -> Any:
+        np = self._np
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(r) for r in rows])
+        indices = np.fromiter((c for r in rows for c in r), dtype=np.int64, count=int(indptr[-1]))
+        data = np.ones(len(indices), dtype=np.float64)
+        return self._sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(_SKILL_NAMES)))
+
+    def _resume_matrices(self) -> Tuple[Any, Any, Any, List[str], Dict[str, int]]:
+        """Weighted resume matrix, skill matrix, idf and a consistent id/row snapshot.
+
+        The log-tf rows are views over the append buffers, so a rebuild after
+        new uploads only reapplies IDF and row normalization.
+        """
+        with self._lock:
+            if self._cache is not None:
+                return self._cache
+            np = self._np
+            n_docs, n_terms = len(self._ids), len(self._vocab)
+            logtf = self._sparse.csr_matrix(
+                (self._logtf[:self._nnz], self._indices[:self._nnz], self._indptr[:n_docs + 1]),
+                shape=(n_docs, n_terms),
+                copy=False,
+            )
+            skills = self._sparse.csr_matrix(
+                (np.ones(self._skill_nnz), self._skill_indices[:self._skill_nnz], self._skill_indptr[:n_docs + 1]),
+                shape=(n_docs, len(_SKILL_NAMES)),
+                copy=False,
+            )
+            idf = self._idf(n_docs, n_terms)
+            self._cache = (self._normalize(logtf, idf), skills, idf, list(self._ids), dict(self._row_of))
+            return self._cache
+
+    def _job_matrices(self, job_texts: Sequence[str], idf: Any) -> Tuple[Any, Any]:
+        np = self._np
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        skill_rows: List[List[int]] = []
+        for text in job_texts:
+            tokens = tokenize(text)
+            counts: Dict[int, int] = {}
+            for tok in tokens:
+                # Terms no resume contains cannot contribute to a dot product
+                col = self._vocab.get(tok)
+                if col is not None and col < len(idf):
+                    counts[col] = counts.get(col, 0) + 1
+            cols = sorted(counts)
+            indices.extend(cols)
+            data.extend(counts[c] for c in cols)
+            indptr.append(len(indices))
+            skill_rows.append(extract_skill_columns(tokens))
+        logtf = self._sparse.csr_matrix(
+            (1.0 + np.log(np.asarray(data, dtype=np.float64)), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(job_texts), len(idf)),
+        )
+        return self._normalize(logtf, idf), self._skill_matrix(skill_rows)
+
+    def _score(self, job_texts: Sequence[str], resume_ids: Optional[Iterable[str]]) -> Tuple[List[str], Any, Any, Any]:
+        np = self._np
+        resumes_w, resume_skills, idf, ids, row_of = self._resume_matrices()
+        if resume_ids is not None:
+            rows = []
+            selected = []
+            for rid in resume_ids:
+                row = row_of.get(rid)
+                if row is None:
+                    raise KeyError(rid)
+                rows.append(row)
+                selected.append(rid)
+            resumes_w = resumes_w[rows]
+            resume_skills = resume_skills[rows]
+            ids = selected
+
+        jobs_w, job_skills = self._job_matrices(job_texts, idf)
+        text_sim = np.asarray((resumes_w @ jobs_w.T).todense())
+
+        required = np.asarray(job_skills.sum(axis=1)).ravel()
+        overlap = np.asarray((resume_skills @ job_skills.T).todense())
+        coverage = overlap / np.where(required == 0, 1.0, required)
+        # Jobs that name no taxonomy skills are scored on text similarity alone
+        skill_w = np.where(required == 0, 0.0, self.skill_weight)
+        scores = (1.0 - skill_w) * text_sim + skill_w * coverage
+        return ids, np.round(scores * 100, 1), np.round(coverage * 100, 1), resume_skills
+
+    def score(self, job_texts: Sequence[str], resume_ids: Optional[Iterable[str]] = None) -> Tuple[List[str], Any, Any]:
+        """Score resumes x jobs in one pass.
+
+        Returns (resume_ids, scores, skill_coverage) where scores and
+        skill_coverage are dense arrays of shape (n_resumes, n_jobs) in 0-100.
+        """
+        ids, scores, coverage, _ = self._score(job_texts, resume_ids)
+        return ids, scores, coverage
+
+    def rank(self, job_texts: Sequence[str], resume_ids: Optional[Iterable[str]] = None, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rank resumes per job and report matched/missing taxonomy skills."""
+        np = self._np
+        ids, scores, coverage, resume_skills = self._score(job_texts, resume_ids)
+        skill_of = [set(resume_skills.indices[resume_skills.indptr[i]:resume_skills.indptr[i + 1]].tolist()) for i in range(len(ids))]
+        results: List[Dict[str, Any]] = []
+        for j, text in enumerate(job_texts):
+            wanted = set(extract_skill_columns(tokenize(text)))
+            order = np.argsort(-scores[:, j], kind="stable")
+            if top is not None:
+                order = order[:top]
+            matches = []
+            for i in order:
+                have = skill_of[int(i)]
+                matches.append({
+                    "resumeId": ids[int(i)],
+                    "score": float(scores[i, j]),
+                    "skillCoverage": float(coverage[i, j]),
+                    "matchedSkills": [_SKILL_NAMES[c] for c in sorted(wanted & have)],
+                    "missingSkills": [_SKILL_NAMES[c] for c in sorted(wanted - have)],
+                })
+            results.append({"jobIndex": j, "matches": matches})
+        return results
+
+
+def match_resumes(resume_texts: Sequence[str], job_texts: Sequence[str]) -> Any:
+    """Score N resume texts against M job descriptions without a stored index.
+
+    Returns a dense (N, M) array of match scores in 0-100.
+    """
+    matcher = ResumeMatcher()
+    for i, text in enumerate(resume_texts):
+        matcher.add_resume(str(i), text)
+    _, scores, _ = matcher.score(job_texts)
+    return scores
@@ -3,6 +3,8 @@ import io
 import re
 from typing import Optional
 
+from services.docx_reader import extract_docx_text
+
 
 def _normalize_whitespace(text: str) -> str:
     text = re.sub(r"\r\n?|\n|\u2028|\u2029", "\n", text)
@@ -28,6 +30,17 @@ def _extract_pdf(path: str) -> str:
 
 
 def _extract_docx(path: str) -> str:
+    try:
+        return extract_docx_text(path)
+    except Exception as fast_error:
+        # Fall back to the full object model for files the streaming reader rejects
+        try:
+            return _extract_docx_python_docx(path)
+        except RuntimeError:
+            raise RuntimeError(f"Failed to extract text from DOCX: {fast_error}")
+
+
+def _extract_docx_python_docx(path: str) -> str:
     try:
         import docx  # python-docx
     except Exception as e:
@@ -0,0 +1,326 @@
+import json
+import math
+from itertools import islice
+import re
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+# Returned by a node check when the value cannot be recovered locally
+MISSING: Any = _Missing()
+
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+class RepairReport:
+    def __init__(self) -> None:
+        self.repairs: List[str] = []
+        # Top-level fields that have to be requested from the model again
+        self.unrecoverable: List[str] = []
+
+    def note(self, path: str, what: str) -> None:
+        self.repairs.append(f"{path or '$'}: {what}")
+
+    @property
+    def repaired(self) -> bool:
+        return bool(self.repairs)
+
+
+# --- JSON text repair -------------------------------------------------------
+
+def _close_truncated(text: str) -> Iterator[str]:
+    """Candidate completions for JSON that was cut off mid-stream.
+
+    When the document stops right after a complete value, the first candidate
+    closes it where it stops. A trailing string or bare scalar may itself be
+    cut short ("8" from "85"), so in that case only cuts back to earlier
+    commas are offered and the half-written key or value is dropped instead
+    of guessed. Candidates are built lazily, newest cut first, so callers
+    that stop early never copy the rest of the document.
+    """
+    stack: List[str] = []
+    cuts: List[Tuple[int, str]] = []
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            if stack:
+                stack.pop()
+        elif ch == ",":
+            cuts.append((i, "".join(reversed(stack))))
+
+    tail = text.rstrip()
+    if not in_string and tail[-1:] in ("", ",", '"', "{", "[", "}", "]"):
+        if tail.endswith(","):
+            tail = tail[:-1]
+        yield tail + "".join(reversed(stack))
+    for pos, closers in reversed(cuts):
+        yield text[:pos] + closers
+
+
+def parse_json(raw: str) -> Tuple[Any, bool]:
+    """Parse model output, repairing fences and truncation.
+
+    Returns (value, repaired). Raises ValueError if nothing usable remains.
+    """
+    try:
+        return json.loads(raw), False
+    except json.JSONDecodeError:
+        pass
+
+    text = _FENCE_RE.sub("", raw).strip()
+    start = min((i for i in (text.find("{"), text.find("[")) if i >= 0), default=-1)
+    if start < 0:
+        raise ValueError("No JSON object found in model response")
+    text = text[start:]
+    try:
+        # Tolerates trailing chatter after a complete document ("... Hope this helps")
+        value, _ = json.JSONDecoder().raw_decode(text)
+        return value, True
+    except json.JSONDecodeError:
+        pass
+
+    for candidate in islice(_close_truncated(text), 64):
+        try:
+            return json.loads(candidate), True
+        except json.JSONDecodeError:
+            continue
+    raise ValueError("Model response is not valid JSON and could not be repaired")
+
+
+# --- Compiled schema checks -------------------------------------------------
+
+Check = Callable[[Any, str, RepairReport], Any]
+
+
+def _compile_number(schema: Dict[str, Any]) -> Check:
+    lo = schema.get("minimum")
+    hi = schema.get("maximum")
+
+    def check(value: Any, path: str, report: RepairReport) -> Any:
+        if isinstance(value, bool) or value is None:
+            return MISSING
+        if not isinstance(value, (int, float)):
+            if not isinstance(value, str):
+                return MISSING
+            match = _NUMBER_RE.search(value)
+            if not match:
+                return MISSING
+            report.note(path, f"coerced {value!r} to number")
+            value = float(match.group())
+            if value.is_integer():
+                value = int(value)
+        # json.loads accepts NaN/Infinity, which compare false against both bounds
+        if not math.isfinite(value):
+            return MISSING
+        if lo is not None and value < lo:
+            report.note(path, f"clamped {value} to {lo}")
+            value = lo
+        elif hi is not None and value > hi:
+            report.note(path, f"clamped {value} to {hi}")
+            value = hi
+        return value
+
+    return check
+
+
+def _compile_string(schema: Dict[str, Any]) -> Check:
+    enum: Optional[List[str]] = schema.get("enum")
+
+    def check(value: Any, path: str, report: RepairReport) -> Any:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            report.note(path, "coerced number to string")
+            value = str(value)
+        if not isinstance(value, str):
+            return MISSING
+        if enum is None:
+            stripped = value.strip()
+            return stripped if stripped else MISSING
+        if value in enum:
+            return value
+        normalized = value.strip().lower()
+        for option in enum:
+            if normalized == option or normalized.startswith(option) or re.search(rf"\b{re.escape(option)}\b", normalized):
+                report.note(path, f"mapped {value!r} to {option!r}")
+                return option
+        return MISSING
+
+    return check
+
+
+def _compile_array(schema: Dict[str, Any]) -> Check:
+    items_schema = schema.get("items", {})
+    item_check = _compile(items_schema)
+    string_items = items_schema.get("type") == "string" and "enum" not in items_schema
+    min_items = schema.get("minItems", 0)
+    max_items = schema.get("maxItems")
+
+    def check(value: Any, path: str, report: RepairReport) -> Any:
+        if isinstance(value, str) and string_items:
+            report.note(path, "split delimited string into list")
+            value = [part for part in re.split(r"[,;\n]", value) if part.strip()]
+        if not isinstance(value, list):
+            return MISSING
+        out: List[Any] = []
+        seen = set()
+        for i, item in enumerate(value):
+            checked = item_check(item, f"{path}[{i}]", report)
+            if checked is MISSING:
+                report.note(path, f"dropped invalid item {i}")
+                continue
+            if string_items:
+                key = checked.casefold()
+                if key in seen:
+                    report.note(path, f"dropped duplicate {checked!r}")
+                    continue
+                seen.add(key)
+            out.append(checked)
+        if max_items is not None and len(out) > max_items:
+            report.note(path, f"truncated to {max_items} items")
+            out = out[:max_items]
+        # A short list is still usable; only an empty one is worth re-asking for
+        if not out and (min_items or value):
+            return MISSING
+        return out
+
+    return check
+
+
+def _compile_object(schema: Dict[str, Any]) -> Check:
+    props = {name: _compile(sub) for name, sub in schema.get("properties", {}).items()}
+    required = list(schema.get("required", []))
+    # Single-value enums carry no information, so a missing one is filled in
+    constants = {
+        name: sub["enum"][0]
+        for name, sub in schema.get("properties", {}).items()
+        if len(sub.get("enum", [])) == 1
+    }
+
+    def check(value: Any, path: str, report: RepairReport) -> Any:
+        if not isinstance(value, dict):
+            return MISSING
+        out: Dict[str, Any] = {}
+        for name, prop_check in props.items():
+            sub_path = f"{path}.{name}" if path else name
+            if name in value:
+                checked = prop_check(value[name], sub_path, report)
+            else:
+                checked = MISSING
+            if checked is MISSING and name in constants:
+                report.note(sub_path, f"filled constant {constants[name]!r}")
+                checked = constants[name]
+            if checked is MISSING:
+                if name in required:
+                    return MISSING
+                continue
+            out[name] = checked
+        return out
+
+    return check
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    kind = schema.get("type")
+    if kind == "object":
+        return _compile_object(schema)
+    if kind == "array":
+        return _compile_array(schema)
+    if kind in ("number", "integer"):
+        return _compile_number(schema)
+    if kind == "string":
+        return _compile_string(schema)
+    return lambda value, path, report: value
+
+
+class SchemaValidator:
+    """Validator compiled once from a response schema.
+
+    Top-level fields are checked independently so that one broken field does
+    not discard the rest of the response; unrecoverable ones are listed in
+    the report for a targeted re-request.
+    """
+
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        self.schema = schema
+        self.required: List[str] = list(schema.get("required", []))
+        self._fields = {name: _compile(sub) for name, sub in schema.get("properties", {}).items()}
+
+    def validate(self, data: Any) -> Tuple[Dict[str, Any], RepairReport]:
+        report = RepairReport()
+        if not isinstance(data, dict):
+            report.unrecoverable = list(self.required)
+            return {}, report
+        out: Dict[str, Any] = {}
+        for name, check in self._fields.items():
+            checked = check(data[name], name, report) if name in data else MISSING
+            if checked is MISSING:
+                if name in self.required:
+                    report.unrecoverable.append(name)
+                continue
+            out[name] = checked
+        return out, report
+
+    def subschema(self, fields: List[str]) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {name: self.schema["properties"][name] for name in fields},
+            "required": list(fields),
+        }
+
+
+def compile_schema(schema: Dict[str, Any]) -> SchemaValidator:
+    return SchemaValidator(schema)
+
+
+# --- Stats --------------------------------------------------------------------
+
+class ValidationStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, kind: str, repaired: bool = False, rerequested: bool = False, failed: bool = False) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(kind, {"responses": 0, "clean": 0, "repaired": 0, "rerequested": 0, "failed": 0})
+            counts["responses"] += 1
+            counts["repaired"] += int(repaired)
+            counts["rerequested"] += int(rerequested)
+            counts["failed"] += int(failed)
+            counts["clean"] += int(not (repaired or rerequested or failed))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            result: Dict[str, Dict[str, Any]] = {}
+            for kind, counts in self._counts.items():
+                total = counts["responses"] or 1
+                result[kind] = {
+                    **counts,
+                    "repairRate": round(counts["repaired"] / total, 4),
+                    "reRequestRate": round(counts["rerequested"] / total, 4),
+                }
+            return result
+
+
+stats = ValidationStats()
+
+
+def get_validation_stats() -> Dict[str, Dict[str, Any]]:
+    return stats.snapshot()
@@ -0,0 +1,180 @@
+// Load real analysis data from API
+async function loadAnalysisData() {
+    try {
+        const response = await fetch('/api/dashboard');
+        if (!response.ok) {
+            throw new Error('Failed to load analysis data');
+        }
+
+        const dashboardData = await response.json();
+
+        if (!dashboardData.latestAnalysis) {
+            document.getElementById('loadingState').style.display = 'none';
+            document.getElementById('emptyState').classList.remove('hidden');
+            return;
+        }
+
+        const analysis = dashboardData.latestAnalysis;
+
+        // Transform data to match display format
+        const displayData = {
+            ats_score: analysis.ats_score || 0,
+            overall_score: analysis.overall_score || 0,
+            keyword_match: analysis.keyword_match || 0,
+            format_quality: analysis.format_quality || 0,
+            grammar_style: analysis.grammar_style || 0,
+            content_strength: analysis.content_strength || 0,
+            feedback: analysis.feedback || {strengths: [], improvements: [], issues: []},
+            percentiles: dashboardData.percentiles
+        };
+
+        document.getElementById('loadingState').style.display = 'none';
+        displayAnalysis(displayData);
+
+    } catch (error) {
+        console.error('Error loading analysis:', error);
+        document.getElementById('loadingState').style.display = 'none';
+        document.getElementById('emptyState').classList.remove('hidden');
+    }
+}
+
+function displayAnalysis(data) {
+    document.getElementById('loadingState').classList.add('hidden');
+    document.getElementById('analysisContent').style.display = 'block';
+
+    // Animate scores with new metric names
+    animateValue('mainScore', 0, data.ats_score, 1500);
+    animateValue('atsScore', 0, data.ats_score, 1000);
+    animateValue('overallScore', 0, data.overall_score, 1000);
+    animateValue('keywordScore', 0, data.keyword_match, 1000);
+    animateValue('grammarScore', 0, data.grammar_style, 1000);
+    animateValue('formatScore', 0, data.format_quality, 1000);
+    animateValue('contentScore', 0, data.content_strength, 1000);
+
+    // Update score ring with ATS score
+    document.getElementById('scoreRing').style.setProperty('--score', data.ats_score);
+
+    // Set rating based on ATS score
+    setRating(data.ats_score);
+
+    // Animate progress bars
+    setTimeout(() => {
+        setProgress('keyword', data.keyword_match);
+        setProgress('format', data.format_quality);
+        setProgress('grammar', data.grammar_style);
+        setProgress('content', data.content_strength);
+    }, 300);
+
+    // Display feedback
+    displayFeedback(data.feedback);
+
+    displayPercentile(data.percentiles);
+}
+
+function displayPercentile(percentiles) {
+    const el = document.getElementById('scorePercentile');
+    // null until enough users have scores to rank against
+    if (!percentiles || percentiles.ats == null) {
+        el.classList.add('hidden');
+        return;
+    }
+    el.textContent = `Your ATS score is at the ${ordinal(percentiles.ats)} percentile of all users`;
+    el.classList.remove('hidden');
+}
+
+function ordinal(n) {
+    const s = ['th', 'st', 'nd', 'rd'];
+    const v = n % 100;
+    return n + (s[(v - 20) % 10] || s[v] || s[0]);
+}
+
+function animateValue(id, start, end, duration) {
+    const element = document.getElementById(id);
+    const range = end - start;
+    const increment = range / (duration / 16);
+    let current = start;
+
+    const timer = setInterval(() => {
+        current += increment;
+        if ((increment > 0 && current >= end) || (increment < 0 && current <= end)) {
+            element.textContent = Math.round(end);
+            clearInterval(timer);
+        } else {
+            element.textContent = Math.round(current);
+        }
+    }, 16);
+}
+
+function setProgress(name, score) {
+    document.getElementById(name + 'Badge').textContent = score + '%';
+    document.getElementById(name + 'Bar').style.width = score + '%';
+}
+
+function setRating(score) {
+    const ratingEl = document.getElementById('scoreRating');
+    const iconEl = document.getElementById('ratingIcon');
+    const textEl = document.getElementById('ratingText');
+
+    ratingEl.className = 'score-rating';
+
+    if (score >= 85) {
+        ratingEl.classList.add('excellent');
+        iconEl.textContent = '🎉';
+        textEl.textContent = 'Excellent';
+    } else if (score >= 70) {
+        ratingEl.classList.add('good');
+        iconEl.textContent = '👍';
+        textEl.textContent = 'Good';
+    } else if (score >= 50) {
+        ratingEl.classList.add('average');
+        iconEl.textContent = '⚠️';
+        textEl.textContent = 'Average';
+    } else {
+        ratingEl.classList.add('poor');
+        iconEl.textContent = '📉';
+        textEl.textContent = 'Needs Work';
+    }
+}
+
+function displayFeedback(feedback) {
+    const container = document.getElementById('feedbackContainer');
+    let html = '';
+
+    if (feedback.strengths && feedback.strengths.length > 0) {
+        html += `
+            <div class="feedback-card strengths">
+                <div class="feedback-title">✓ Strong Points</div>
+                <ul class="feedback-list">
+                    ${feedback.strengths.map(item => `<li><span>${item}</span></li>`).join('')}
+                </ul>
+            </div>
+        `;
+    }
+
+    if (feedback.improvements && feedback.improvements.length > 0) {
+        html += `
+            <div class="feedback-card improvements">
+                <div class="feedback-title">⚠ Areas to Improve</div>
+                <ul class="feedback-list">
+                    ${feedback.improvements.map(item => `<li><span>${item}</span></li>`).join('')}
+                </ul>
+            </div>
+        `;
+    }
+
+    if (feedback.issues && feedback.issues.length > 0) {
+        html += `
+            <div class="feedback-card issues">
+                <div class="feedback-title">✕ Critical Issues</div>
+                <ul class="feedback-list">
+                    ${feedback.issues.map(item => `<li><span>${item}</span></li>`).join('')}
+                </ul>
+            </div>
+        `;
+    }
+
+    container.innerHTML = html;
+}
+
+// Load analysis on page load
+loadAnalysisData();
@@ -0,0 +1,309 @@
+let currentFilter = 'all';
+
+const mockQuestions = [
+    {
+        id: 1,
+        type: 'behavioral',
+        question: 'Tell me about a time when you had to work under pressure to meet a tight deadline.',
+        sampleAnswer: 'In my previous role, we had a critical project with a two-week deadline that suddenly moved up to one week. I immediately prioritized tasks, communicated with stakeholders, and organized daily check-ins with the team. By focusing on core features and delegating effectively, we delivered the project on time with high quality.',
+        tips: [
+            'Use the STAR method (Situation, Task, Action, Result)',
+            'Focus on your specific contributions',
+            'Quantify your results when possible',
+            'Keep your answer concise (2-3 minutes)'
+        ]
+    },
+    {
+        id: 2,
+        type: 'technical',
+        question: 'Explain the difference between authentication and authorization.',
+        sampleAnswer: 'Authentication is the process of verifying who a user is, typically through credentials like username and password. Authorization determines what an authenticated user is allowed to do - what resources they can access and what actions they can perform. For example, logging into a system is authentication, while accessing admin features is authorization.',
+        tips: [
+            'Start with clear definitions',
+            'Provide real-world examples',
+            'Mention relevant technologies you have used',
+            'Show understanding of security best practices'
+        ]
+    },
+    {
+        id: 3,
+        type: 'situational',
+        question: 'How would you handle a situation where a team member is not contributing equally?',
+        sampleAnswer: 'I would first have a private, one-on-one conversation to understand if there are any underlying issues affecting their performance. I would offer support and clearly communicate expectations. If the situation does not improve, I would document the concerns and involve a manager or HR to find a constructive solution while maintaining team morale.',
+        tips: [
+            'Show empathy and understanding',
+            'Demonstrate leadership and communication skills',
+            'Focus on collaborative problem-solving',
+            'Mention following proper channels'
+        ]
+    },
+    {
+        id: 4,
+        type: 'behavioral',
+        question: 'Describe a situation where you had to learn a new technology quickly.',
+        sampleAnswer: 'When my company decided to migrate to a new cloud platform, I took the initiative to complete online certifications, build sample projects, and participate in community forums. Within two weeks, I became proficient enough to lead the migration for my team and created documentation to help others learn.',
+        tips: [
+            'Highlight your learning methodology',
+            'Show enthusiasm for continuous learning',
+            'Mention resources you used',
+            'Emphasize the positive outcome'
+        ]
+    },
+    {
+        id: 5,
+        type: 'technical',
+        question: 'What is your approach to debugging complex issues in production?',
+        sampleAnswer: 'I follow a systematic approach: first, I gather information about the issue including logs, error messages, and reproduction steps. Then I isolate the problem by checking recent changes, reviewing monitoring tools, and testing hypotheses. I document my findings and implement a fix with proper testing. Finally, I conduct a post-mortem to prevent similar issues.',
+        tips: [
+            'Show your methodical thinking process',
+            'Mention specific tools and techniques',
+            'Emphasize communication during incidents',
+            'Discuss learning from failures'
+        ]
+    },
+    {
+        id: 6,
+        type: 'behavioral',
+        question: 'Tell me about a time you received constructive criticism. How did you handle it?',
+        sampleAnswer: 'During a code review, a senior developer pointed out that my code was not following best practices for error handling. Instead of being defensive, I asked questions to understand better, reviewed recommended resources, and refactored my code. I now see code reviews as valuable learning opportunities and regularly seek feedback.',
+        tips: [
+            'Show openness to feedback',
+            'Demonstrate growth mindset',
+            'Explain what you learned',
+            'Show how it improved your work'
+        ]
+    },
+    {
+        id: 7,
+        type: 'situational',
+        question: 'What would you do if you disagreed with your manager\'s technical decision?',
+        sampleAnswer: 'I would first ensure I fully understand their reasoning by asking clarifying questions. Then I would present my concerns with data and alternative solutions in a respectful manner. If they still disagree, I would support their decision while documenting my concerns. Building trust through professional disagreement is important for team growth.',
+        tips: [
+            'Show respect for hierarchy',
+            'Emphasize data-driven discussions',
+            'Demonstrate team player mentality',
+            'Balance conviction with flexibility'
+        ]
+    },
+    {
+        id: 8,
+        type: 'technical',
+        question: 'How do you ensure code quality in your projects?',
+        sampleAnswer: 'I use multiple strategies: writing unit and integration tests with good coverage, conducting thorough code reviews, following coding standards and style guides, using static analysis tools, implementing CI/CD pipelines, and regularly refactoring. I also believe in pair programming for complex features and maintaining clear documentation.',
+        tips: [
+            'Mention specific tools and practices',
+            'Show understanding of testing pyramid',
+            'Discuss automated vs manual processes',
+            'Emphasize continuous improvement'
+        ]
+    },
+    {
+        id: 9,
+        type: 'behavioral',
+        question: 'Describe a project you are most proud of and why.',
+        sampleAnswer: 'I led the development of a customer portal that reduced support tickets by 40%. I was proud because it involved coordinating with multiple teams, making critical architectural decisions, and directly impacting user satisfaction. The project taught me valuable lessons about stakeholder management and the importance of user-centered design.',
+        tips: [
+            'Choose a project with measurable impact',
+            'Highlight your specific role',
+            'Discuss challenges overcome',
+            'Show passion and enthusiasm'
+        ]
+    },
+    {
+        id: 10,
+        type: 'situational',
+        question: 'How would you prioritize multiple urgent tasks with conflicting deadlines?',
+        sampleAnswer: 'I would assess each task\'s business impact, dependencies, and actual urgency versus perceived urgency. I would communicate with stakeholders to understand their needs and negotiate realistic deadlines. I would then create a clear action plan, delegate where possible, and provide regular updates on progress. Transparency and communication are key.',
+        tips: [
+            'Show strategic thinking',
+            'Emphasize communication skills',
+            'Demonstrate time management',
+            'Mention stakeholder management'
+        ]
+    },
+    {
+        id: 11,
+        type: 'technical',
+        question: 'Explain how you would design a scalable system for handling high traffic.',
+        sampleAnswer: 'I would implement load balancing across multiple servers, use caching strategies (CDN, Redis), implement database replication and sharding, use message queues for async processing, implement auto-scaling, and optimize database queries. I would also monitor system performance and use circuit breakers for fault tolerance.',
+        tips: [
+            'Discuss both vertical and horizontal scaling',
+            'Mention specific technologies',
+            'Consider different components (frontend, backend, database)',
+            'Address monitoring and reliability'
+        ]
+    },
+    {
+        id: 12,
+        type: 'behavioral',
+        question: 'Tell me about a time you had to give difficult feedback to a colleague.',
+        sampleAnswer: 'A team member\'s code quality was affecting our sprint goals. I scheduled a private meeting, used specific examples, focused on behaviors not personality, and offered to help them improve. We created an action plan together with regular check-ins. Their performance improved significantly, and we maintained a positive working relationship.',
+        tips: [
+            'Show emotional intelligence',
+            'Focus on constructive approach',
+            'Demonstrate leadership skills',
+            'Emphasize positive outcomes'
+        ]
+    }
+];
+
+async function loadQuestions() {
+    try {
+        // First get the dashboard to find the latest resume ID
+        const dashboardResponse = await fetch('/api/dashboard');
+        if (!dashboardResponse.ok) {
+            throw new Error('Failed to load dashboard');
+        }
+
+        const dashboardData = await dashboardResponse.json();
+
+        // Check if we have a latest analysis with resume data
+        if (!dashboardData.latestAnalysis || !dashboardData.latestAnalysis.resumeId) {
+            throw new Error('No resume found');
+        }
+
+        const resumeId = dashboardData.latestAnalysis.resumeId;
+
+        // Now fetch ALL questions for this resume
+        const questionsResponse = await fetch(`/api/interview/${resumeId}`);
+        if (!questionsResponse.ok) {
+            throw new Error('Failed to load questions');
+        }
+
+        const questions = await questionsResponse.json();
+
+        // Transform API data to match display format
+        const formattedQuestions = questions.map((q, index) => ({
+            id: index + 1,
+            type: q.type || 'technical',
+            question: q.question || 'No question available',
+            sampleAnswer: q.sampleAnswer || 'No sample answer available',
+            difficulty: q.difficulty || 'medium',
+            tips: getTipsForQuestionType(q.type || 'technical')
+        }));
+
+        loadedQuestions = formattedQuestions;
+        displayQuestions(formattedQuestions);
+        document.getElementById('loadingState').classList.remove('active');
+        document.getElementById('questionsContainer').style.display = 'grid';
+
+        console.log(`Loaded ${formattedQuestions.length} questions:`, 
+            formattedQuestions.reduce((acc, q) => {
+                acc[q.type] = (acc[q.type] || 0) + 1;
+                return acc;
+            }, {}));
+
+    } catch (error) {
+        console.error('Error loading questions:', error);
+        // Fallback to mock questions if API fails
+        loadedQuestions = mockQuestions;
+        displayQuestions(mockQuestions);
+        document.getElementById('loadingState').classList.remove('active');
+        document.getElementById('questionsContainer').style.display = 'grid';
+    }
+}
+
+function getTipsForQuestionType(type) {
+    if (type === 'technical') {
+        return [
+            'Start with clear definitions and concepts',
+            'Provide real-world examples from your experience',
+            'Mention specific technologies you have used',
+            'Show understanding of best practices'
+        ];
+    } else if (type === 'behavioral') {
+        return [
+            'Use the STAR method (Situation, Task, Action, Result)',
+            'Focus on your specific contributions',
+            'Quantify your results when possible',
+            'Keep your answer concise (2-3 minutes)'
+        ];
+    } else if (type === 'situational') {
+        return [
+            'Think through the problem step by step',
+            'Ask clarifying questions if needed',
+            'Explain your reasoning process',
+            'Consider multiple approaches and trade-offs'
+        ];
+    } else {
+        return [
+            'Structure your answer clearly',
+            'Provide specific examples',
+            'Show your thought process',
+            'Be concise and focused'
+        ];
+    }
+}
+
+function displayQuestions(questions) {
+    const container = document.getElementById('questionsContainer');
+    const filtered = currentFilter === 'all' 
+        ? questions 
+        : questions.filter(q => q.type === currentFilter);
+
+    container.innerHTML = filtered.map((q, index) => `
+        <div class="question-card" data-type="${q.type}">
+            <div class="question-header">
+                <div class="question-number">${index + 1}</div>
+                <div class="question-tags">
+                    <span class="question-tag ${q.type}">${capitalize(q.type)}</span>
+                </div>
+            </div>
+            <div class="question-text">${q.question}</div>
+            <div class="answer-section">
+                <div class="answer-label">
+                    <span>💡</span>
+                    <span>Sample Answer</span>
+                </div>
+                <div class="answer-text">${q.sampleAnswer}</div>
+            </div>
+            <div class="tips-section">
+                <div class="tips-label">
+                    <span>✨</span>
+                    <span>Tips for Answering</span>
+                </div>
+                <ul class="tips-list">
+                    ${q.tips.map(tip => `<li>${tip}</li>`).join('')}
+                </ul>
+            </div>
+            <div class="question-actions">
+                <button class="action-btn bookmark" onclick="toggleBookmark(this, ${q.id})">
+                    <span>⭐</span>
+                    <span>Bookmark</span>
+                </button>
+            </div>
+        </div>
+    `).join('');
+}
+
+function capitalize(str) {
+    return str.charAt(0).toUpperCase() + str.slice(1);
+}
+
+let loadedQuestions = [];
+
+document.addEventListener('DOMContentLoaded', () => {
+    const filterTags = document.querySelectorAll('.filter-tag');
+    filterTags.forEach(tag => {
+        tag.addEventListener('click', function() {
+            filterTags.forEach(t => t.classList.remove('active'));
+            this.classList.add('active');
+            currentFilter = this.getAttribute('data-filter');
+            displayQuestions(loadedQuestions);
+        });
+    });
+
+    loadQuestions();
+});
+
+function toggleBookmark(button, questionId) {
+    button.classList.toggle('active');
+    const bookmarkedCount = document.querySelectorAll('.action-btn.bookmark.active').length;
+    document.getElementById('bookmarked').textContent = bookmarkedCount;
+
+    if (button.classList.contains('active')) {
+        button.innerHTML = '<span>⭐</span><span>Bookmarked</span>';
+    } else {
+        button.innerHTML = '<span>⭐</span><span>Bookmark</span>';
+    }
+}
@@ -0,0 +1,138 @@
+// Animate progress bar on load
+window.addEventListener('load', () => {
+    const progressBar = document.querySelector('.progress-bar');
+    setTimeout(() => {
+        progressBar.style.width = '45%';
+    }, 500);
+});
+
+// Mark phase as completed
+function markAsCompleted(button, phaseId) {
+    const timelineItem = button.closest('.timeline-item');
+    const icon = timelineItem.querySelector('.timeline-icon');
+    const status = timelineItem.querySelector('.timeline-status');
+    const actionsDiv = timelineItem.querySelector('.timeline-actions');
+
+    // Update icon
+    icon.className = 'timeline-icon completed';
+    icon.textContent = '✓';
+
+    // Update status
+    status.className = 'timeline-status completed';
+    status.textContent = 'Completed';
+
+    // Update actions
+    actionsDiv.innerHTML = `
+        <button class="action-btn secondary" onclick="markAsInProgress(this, ${phaseId})">
+            <span>🔄</span>
+            <span>Mark as In Progress</span>
+        </button>
+    `;
+
+    // Update progress
+    updateProgress();
+
+}
+
+// Mark phase as in progress
+function markAsInProgress(button, phaseId) {
+    const timelineItem = button.closest('.timeline-item');
+    const icon = timelineItem.querySelector('.timeline-icon');
+    const status = timelineItem.querySelector('.timeline-status');
+    const actionsDiv = timelineItem.querySelector('.timeline-actions');
+
+    // Update icon
+    icon.className = 'timeline-icon current';
+    icon.textContent = '🎯';
+
+    // Update status
+    status.className = 'timeline-status current';
+    status.textContent = 'In Progress';
+
+    // Update actions
+    actionsDiv.innerHTML = `
+        <button class="action-btn primary">
+            <span>▶️</span>
+            <span>Continue Learning</span>
+        </button>
+        <button class="action-btn secondary" onclick="markAsCompleted(this, ${phaseId})">
+            <span>✓</span>
+            <span>Mark as Completed</span>
+        </button>
+    `;
+
+    // Update progress
+    updateProgress();
+
+}
+
+// Start a new phase
+function startPhase(phaseId) {
+    const timelineItem = event.target.closest('.timeline-item');
+    const icon = timelineItem.querySelector('.timeline-icon');
+    const status = timelineItem.querySelector('.timeline-status');
+    const actionsDiv = timelineItem.querySelector('.timeline-actions');
+
+    // Update icon
+    icon.className = 'timeline-icon current';
+    icon.textContent = '🎯';
+
+    // Update status
+    status.className = 'timeline-status current';
+    status.textContent = 'In Progress';
+
+    // Update actions
+    actionsDiv.innerHTML = `
+        <button class="action-btn primary">
+            <span>▶️</span>
+            <span>Continue Learning</span>
+        </button>
+        <button class="action-btn secondary" onclick="markAsCompleted(this, ${phaseId})">
+            <span>✓</span>
+            <span>Mark as Completed</span>
+        </button>
+    `;
+
+    // Update progress
+    updateProgress();
+
+}
+
+// Update overall progress
+function updateProgress() {
+    const completed = document.querySelectorAll('.timeline-icon.completed').length;
+    const total = document.querySelectorAll('.timeline-item').length;
+    const percentage = Math.round((completed / total) * 100);
+
+    const progressBar = document.querySelector('.progress-bar');
+    progressBar.style.width = percentage + '%';
+
+    const progressText = progressBar.parentElement.nextElementSibling;
+    progressText.textContent = `${percentage}% Complete - Keep up the great work!`;
+
+    // Update milestone count
+    document.querySelector('.progress-stat-number').textContent = completed;
+}
+
+
+// Add scroll animations
+const observerOptions = {
+    threshold: 0.1,
+    rootMargin: '0px 0px -100px 0px'
+};
+
+const observer = new IntersectionObserver((entries) => {
+    entries.forEach(entry => {
+        if (entry.isIntersecting) {
+            entry.target.style.opacity = '1';
+            entry.target.style.transform = 'translateY(0)';
+        }
+    });
+}, observerOptions);
+
+document.querySelectorAll('.timeline-item').forEach(el => {
+    el.style.opacity = '0';
+    el.style.transform = 'translateY(30px)';
+    el.style.transition = 'all 0.6s ease';
+    observer.observe(el);
+});
@@ -0,0 +1,140 @@
+const uploadZone = document.getElementById('uploadZone');
+const uploadIcon = document.getElementById('uploadIcon');
+const uploadTitle = document.getElementById('uploadTitle');
+const uploadDesc = document.getElementById('uploadDesc');
+const fileInput = document.getElementById('fileInput');
+const uploadBtn = document.getElementById('uploadBtn');
+const progressContainer = document.getElementById('progressContainer');
+const progressFill = document.getElementById('progressFill');
+const progressText = document.getElementById('progressText');
+const fileInfoDisplay = document.getElementById('fileInfoDisplay');
+const fileName = document.getElementById('fileName');
+
+uploadZone.addEventListener('dragover', (e) => {
+    e.preventDefault();
+    uploadZone.classList.add('drag-over');
+});
+
+uploadZone.addEventListener('dragleave', () => {
+    uploadZone.classList.remove('drag-over');
+});
+
+uploadZone.addEventListener('drop', (e) => {
+    e.preventDefault();
+    uploadZone.classList.remove('drag-over');
+
+    if (e.dataTransfer.files && e.dataTransfer.files[0]) {
+        fileInput.files = e.dataTransfer.files;
+        handleFileUpload(e.dataTransfer.files[0]);
+    }
+});
+
+uploadZone.addEventListener('click', (e) => {
+    if (e.target !== fileInput && !e.target.closest('.upload-button')) {
+        fileInput.click();
+    }
+});
+
+fileInput.addEventListener('change', (e) => {
+    if (e.target.files.length > 0) {
+        handleFileUpload(e.target.files[0]);
+    }
+});
+
+async function handleFileUpload(file) {
+    const validTypes = ['application/pdf', 'application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'];
+    const maxSize = 10 * 1024 * 1024;
+
+    if (!validTypes.includes(file.type)) {
+        showError('Please upload a PDF, DOC, or DOCX file');
+        return;
+    }
+
+    if (file.size > maxSize) {
+        showError('File size must be less than 10MB');
+        return;
+    }
+
+    fileName.textContent = file.name;
+    fileInfoDisplay.style.display = 'inline-flex';
+
+    uploadZone.classList.add('uploading');
+    uploadIcon.innerHTML = '⏳';
+    uploadTitle.textContent = 'Analyzing Your Resume...';
+    uploadDesc.textContent = 'Please wait while our AI processes your document';
+    uploadBtn.style.display = 'none';
+    progressContainer.classList.add('active');
+
+    try {
+        // Create FormData for file upload
+        const formData = new FormData();
+        formData.append('resume', file);
+
+        // Simulate progress while uploading
+        const progressInterval = setInterval(() => {
+            const currentWidth = parseInt(progressFill.style.width) || 0;
+            if (currentWidth < 90) {
+                const newWidth = currentWidth + Math.random() * 10;
+                progressFill.style.width = Math.min(newWidth, 90) + '%';
+                progressText.textContent = `Analyzing... ${Math.round(Math.min(newWidth, 90))}%`;
+            }
+        }, 200);
+
+        // Upload and analyze
+        const response = await fetch('/api/resumes/upload', {
+            method: 'POST',
+            body: formData
+        });
+
+        clearInterval(progressInterval);
+
+        if (!response.ok) {
+            const errorData = await response.json();
+            throw new Error(errorData.error || 'Upload failed');
+        }
+
+        await response.json();
+
+        // Complete progress
+        progressFill.style.width = '100%';
+        progressText.textContent = 'Analysis complete - 100%';
+
+        uploadZone.classList.remove('uploading');
+        uploadZone.classList.add('success');
+        uploadIcon.innerHTML = '✅';
+        uploadTitle.textContent = 'Analysis Complete!';
+        uploadDesc.textContent = 'Your resume has been successfully analyzed';
+
+        // Redirect to dashboard after 2 seconds
+        setTimeout(() => {
+            window.location.href = '/analysis';
+        }, 2000);
+
+    } catch (error) {
+        showError(error.message || 'Upload failed. Please try again.');
+    }
+}
+
+function showError(message) {
+    uploadZone.classList.remove('uploading', 'success');
+    uploadZone.classList.add('error');
+    uploadIcon.innerHTML = '❌';
+    uploadTitle.textContent = 'Upload Failed';
+    uploadDesc.textContent = message;
+    progressContainer.classList.remove('active');
+    uploadBtn.style.display = 'inline-flex';
+
+    setTimeout(resetUploadZone, 4000);
+}
+
+function resetUploadZone() {
+    uploadZone.classList.remove('uploading', 'success', 'error');
+    uploadIcon.innerHTML = '☁️';
+    uploadTitle.textContent = 'Drag & Drop Your Resume';
+    uploadDesc.textContent = 'or click the button below to browse files';
+    progressContainer.classList.remove('active');
+    progressFill.style.width = '0%';
+    uploadBtn.style.display = 'inline-flex';
+    fileInfoDisplay.style.display = 'none';
+    fileInput.value = '';
+}
@@ -1,6 +1,8 @@
 import uuid
 from typing import Dict, List, Any, Optional
 
+from services.analytics import ScoreAnalytics
+
 
 class Storage:
     def __init__(self) -> None:
@@ -9,6 +11,8 @@ class Storage:
         self.interview_questions: List[Dict[str, Any]] = []
         self.roadmaps: List[Dict[str, Any]] = []
         self.user_progress: Dict[str, Dict[str, Any]] = {}
+        self.analytics = ScoreAnalytics()
+        self.documents: Dict[str, Dict[str, Any]] = {}
 
     def create_resume(self, data: Dict[str, Any]) -> Dict[str, Any]:
         resume = {
@@ -27,6 +31,12 @@ class Storage:
             }
         return resume
 
+    def save_document(self, resume_id: str, document: Dict[str, Any]) -> None:
+        self.documents[resume_id] = document
+
+    def get_document_by_resume_id(self, resume_id: str) -> Optional[Dict[str, Any]]:
+        return self.documents.get(resume_id)
+
     def create_mock_analysis(self, resume_id: str, text: str) -> Dict[str, Any]:
         # Heuristic mock similar to TS version
         lower = text.lower()
@@ -143,6 +153,12 @@ class Storage:
         if p["bestAtsScore"] > 80 and "high_ats_score" not in p["achievements"]:
             p["achievements"].append("high_ats_score")
 
+    def record_scores(self, user_id: str, analysis: Dict[str, Any]) -> None:
+        self.analytics.record(user_id, analysis)
+
+    def get_score_history(self, user_id: str, max_points: int = 100) -> Dict[str, Any]:
+        return self.analytics.history(user_id, max_points)
+
     def get_dashboard(self, user_id: str) -> Dict[str, Any]:
         user_progress = self.user_progress.get(user_id)
         latest_analysis = next((a for a in reversed(self.analyses) if any(r for r in self.resumes if r["id"] == a["resumeId"] and r["userId"] == user_id)), None)
@@ -162,6 +178,7 @@ class Storage:
             "interviewQuestions": interview_questions[:5],
             "careerRoadmap": career_roadmap,
             "totalInterviewQuestions": len(interview_questions),
+            "percentiles": self.analytics.percentiles(user_id),
         }
 
     def get_analysis_by_resume_id(self, resume_id: str) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,52 @@
+from services.document import format_for_prompt, parse_resume_document
+
+
+def test_all_caps_name_stays_in_contact_block():
+    text = "\n".join([
+        "JANE DOE",
+        "jane.doe@example.com",
+        "+1 555 123 4567",
+        "EXPERIENCE",
+        "Engineer | Acme | 2020 - Present",
+        "- Shipped things",
+    ])
+    document = parse_resume_document(text)
+
+    assert document["contact"]["name"] == "JANE DOE"
+    assert document["contact"]["email"] == "jane.doe@example.com"
+    assert document["contact"]["phone"] == "+1 555 123 4567"
+    assert [s["name"] for s in document["sections"]] == ["experience"]
+
+
+def test_all_caps_employer_lines_stay_in_experience():
+    text = "\n".join([
+        "Jane Doe",
+        "EXPERIENCE",
+        "ACME CORP",
+        "Senior Engineer | 2021 - Present",
+        "- Led the platform team",
+        "GOOGLE",
+        "Software Engineer | 2018 - 2021",
+        "- Built search features",
+        "EDUCATION",
+        "BSc Computer Science | 2014 - 2018",
+    ])
+    document = parse_resume_document(text)
+
+    assert [s["name"] for s in document["sections"]] == ["experience", "education"]
+    experience = document["experience"]
+    assert [e["title"] for e in experience] == ["ACME CORP", "GOOGLE"]
+    assert experience[0]["dates"]["current"] is True
+    assert [b["text"] for b in experience[1]["bullets"]] == ["Built search features"]
+
+    prompt = format_for_prompt(document, text)
+    assert "[EXPERIENCE] EXPERIENCE\nACME CORP" in prompt
+    assert "GOOGLE" in prompt.split("[EDUCATION]")[0]
+    assert "[OTHER]" not in prompt
+
+
+def test_single_date_has_same_shape_as_range():
+    document = parse_resume_document("Jane Doe\nEDUCATION\nBSc Computer Science\nGraduated 2018")
+
+    dates = document["education"][0]["dates"]
+    assert dates == {"raw": "2018", "start": None, "end": "2018", "current": False}